@@ -1,36 +1,137 @@
 import sys
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QLabel, QLineEdit, QPushButton, QListWidget, QComboBox, 
-                            QDateEdit, QTimeEdit, QSpinBox, QTabWidget, QMessageBox)
-from PyQt5.QtCore import QDate, QTime, Qt
-from PyQt5.QtGui import QFont, QIcon
+from typing import NamedTuple
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                            QLabel, QLineEdit, QPushButton, QListWidget, QListWidgetItem,
+                            QComboBox, QDateEdit, QTimeEdit, QSpinBox, QTabWidget, QMessageBox)
+from PyQt5.QtCore import QDate, QTime, QTimer, Qt
+from PyQt5.QtGui import QIcon
+
+class HallDef(NamedTuple):
+    number: int
+    price: int
+    capacity: int
+
+class EquipmentDef(NamedTuple):
+    name: str
+    price: int
+
+# Справочники не меняются, поэтому создаются один раз при загрузке модуля
+_HALLS = (
+    HallDef(1, 2000, 5),
+    HallDef(2, 3000, 10),
+    HallDef(3, 2500, 8),
+)
+_EQUIPMENT = (
+    EquipmentDef("Профессиональный свет", 500),
+    EquipmentDef("Фон белый", 300),
+    EquipmentDef("Фон черный", 300),
+    EquipmentDef("Реквизит", 200),
+)
+
+# Таблица стилей приложения; заголовок статистики оформляется через objectName
+_STYLESHEET = """
+QMainWindow {
+    background-color: #f5f5f5;
+}
+
+QLabel {
+    font-size: 14px;
+    color: #333;
+}
+
+QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    font-size: 14px;
+    border-radius: 4px;
+    min-width: 100px;
+}
+
+QPushButton:hover {
+    background-color: #45a049;
+}
+
+QPushButton:pressed {
+    background-color: #3d8b40;
+}
+
+QLineEdit, QComboBox, QDateEdit, QTimeEdit, QSpinBox, QListWidget {
+    padding: 6px;
+    border: 1px solid #ccc;
+    border-radius: 4px;
+    font-size: 14px;
+}
+
+QTabWidget::pane {
+    border: 1px solid #ddd;
+    background: white;
+}
+
+QTabBar::tab {
+    background: #e0e0e0;
+    padding: 8px 16px;
+    border: 1px solid #ddd;
+    border-bottom: none;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+
+QTabBar::tab:selected {
+    background: white;
+    margin-bottom: -1px;
+}
+
+QListWidget {
+    border: 1px solid #ddd;
+    background: white;
+    alternate-background-color: #f9f9f9;
+}
+
+QListWidget::item {
+    padding: 6px;
+    border-bottom: 1px solid #eee;
+}
+
+QListWidget::item:selected {
+    background-color: #e0f7fa;
+    color: black;
+}
+
+QLabel#statsTitle {
+    font-size: 16pt;
+    font-weight: bold;
+    color: #2c3e50;
+    margin-bottom: 15px;
+}
+"""
 
 class PhotoStudioApp(QMainWindow):
+    _CAMERA_ICON = None
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Фотостудия - Система бронирования")
-        self.setWindowIcon(QIcon("camera_icon.png"))
         self.setMinimumSize(900, 600)
         
         # Основные данные
         self.clients = []
         self.bookings = []
-        self.halls = [
-            {"number": 1, "price": 2000, "capacity": 5},
-            {"number": 2, "price": 3000, "capacity": 10},
-            {"number": 3, "price": 2500, "capacity": 8}
-        ]
-        self.equipment = [
-            {"name": "Профессиональный свет", "price": 500},
-            {"name": "Фон белый", "price": 300},
-            {"name": "Фон черный", "price": 300},
-            {"name": "Реквизит", "price": 200}
-        ]
-        
-        self.init_ui()
+        # Счетчик id клиентов не зависит от длины списка
+        self._next_client_id = 1
+        # Доход копится при создании бронирований, а не пересчитывается в отчете
+        self._total_income = 0
+        self.halls = _HALLS
+        self.equipment = _EQUIPMENT
+        
+        # Сразу строим только первую вкладку, остальное - после запуска цикла событий
+        self._init_ui_fast()
+        # Стили нужны уже для первого кадра, иначе окно мигнет без оформления
         self.apply_styles()
+        QTimer.singleShot(0, self._init_ui_deferred)
         
-    def init_ui(self):
+    def _init_ui_fast(self):
         # Главный виджет и layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -39,22 +140,13 @@ class PhotoStudioApp(QMainWindow):
         # Создаем вкладки
         tab_widget = QTabWidget()
         main_layout.addWidget(tab_widget)
+        self.tab_widget = tab_widget
         
         # Вкладка бронирований
         booking_tab = QWidget()
         self.setup_booking_tab(booking_tab)
         tab_widget.addTab(booking_tab, "Бронирования")
         
-        # Вкладка клиентов
-        clients_tab = QWidget()
-        self.setup_clients_tab(clients_tab)
-        tab_widget.addTab(clients_tab, "Клиенты")
-        
-        # Вкладка отчетов
-        reports_tab = QWidget()
-        self.setup_reports_tab(reports_tab)
-        tab_widget.addTab(reports_tab, "Отчеты")
-        
         # Боковая панель с информацией
         sidebar = QWidget()
         sidebar.setFixedWidth(250)
@@ -82,6 +174,26 @@ class PhotoStudioApp(QMainWindow):
         
         main_layout.addWidget(sidebar)
         
+    def _init_ui_deferred(self):
+        # Вкладка клиентов
+        clients_tab = QWidget()
+        self.setup_clients_tab(clients_tab)
+        self.tab_widget.addTab(clients_tab, "Клиенты")
+        
+        # Вкладка отчетов
+        reports_tab = QWidget()
+        self.setup_reports_tab(reports_tab)
+        self.tab_widget.addTab(reports_tab, "Отчеты")
+        
+        # Иконка не нужна для первой отрисовки окна
+        self._set_window_icon()
+        
+    def _set_window_icon(self):
+        # Иконка читается с диска один раз на процесс
+        if PhotoStudioApp._CAMERA_ICON is None:
+            PhotoStudioApp._CAMERA_ICON = QIcon("camera_icon.png")
+        self.setWindowIcon(PhotoStudioApp._CAMERA_ICON)
+        
     def setup_booking_tab(self, tab):
         layout = QVBoxLayout(tab)
         
@@ -104,7 +216,7 @@ class PhotoStudioApp(QMainWindow):
         hall_layout.addWidget(QLabel("Зал:"))
         self.hall_combo = QComboBox()
         for hall in self.halls:
-            self.hall_combo.addItem(f"Зал {hall['number']} ({hall['price']} руб/час, до {hall['capacity']} чел.)", hall)
+            self.hall_combo.addItem(f"Зал {hall.number} ({hall.price} руб/час, до {hall.capacity} чел.)", hall)
         hall_layout.addWidget(self.hall_combo)
         
         # Дата и время
@@ -132,8 +244,11 @@ class PhotoStudioApp(QMainWindow):
         equipment_layout = QVBoxLayout(equipment_group)
         equipment_layout.addWidget(QLabel("Дополнительное оборудование:"))
         self.equipment_list = QListWidget()
-        for item in self.equipment:
-            self.equipment_list.addItem(f"{item['name']} (+{item['price']} руб/час)")
+        for eq in self.equipment:
+            # Храним саму запись оборудования в элементе, чтобы не разбирать текст
+            item = QListWidgetItem(f"{eq.name} (+{eq.price} руб/час)")
+            item.setData(Qt.UserRole, eq)
+            self.equipment_list.addItem(item)
         self.equipment_list.setSelectionMode(QListWidget.MultiSelection)
         equipment_layout.addWidget(self.equipment_list)
         
@@ -152,6 +267,9 @@ class PhotoStudioApp(QMainWindow):
         # Список бронирований
         bookings_list_label = QLabel("Активные бронирования:")
         self.bookings_list = QListWidget()
+        self.bookings_list.setUniformItemSizes(True)
+        self.bookings_list.setLayoutMode(QListWidget.Batched)
+        self.bookings_list.setBatchSize(100)
         
         layout.addWidget(booking_form)
         layout.addWidget(bookings_list_label)
@@ -205,6 +323,9 @@ class PhotoStudioApp(QMainWindow):
         # Список клиентов
         clients_list_label = QLabel("Список клиентов:")
         self.clients_list = QListWidget()
+        self.clients_list.setUniformItemSizes(True)
+        self.clients_list.setLayoutMode(QListWidget.Batched)
+        self.clients_list.setBatchSize(100)
         
         layout.addWidget(client_form)
         layout.addWidget(clients_list_label)
@@ -215,6 +336,7 @@ class PhotoStudioApp(QMainWindow):
         
         # Статистика
         stats_label = QLabel("Статистика фотостудии")
+        stats_label.setObjectName("statsTitle")
         stats_label.setAlignment(Qt.AlignCenter)
         
         # Виджеты статистики
@@ -222,8 +344,9 @@ class PhotoStudioApp(QMainWindow):
         stats_layout = QVBoxLayout(stats_widget)
         
         # Общая статистика
-        total_stats = QLabel("Всего клиентов: 0\nВсего бронирований: 0\nОбщий доход: 0 руб")
-        total_stats.setAlignment(Qt.AlignCenter)
+        self.total_stats_label = QLabel()
+        self.total_stats_label.setAlignment(Qt.AlignCenter)
+        self.update_stats()
         
         # График занятости (заглушка)
         schedule_label = QLabel("График занятости залов:")
@@ -233,8 +356,9 @@ class PhotoStudioApp(QMainWindow):
         
         # Кнопка обновления
         refresh_btn = QPushButton("Обновить статистику")
+        refresh_btn.clicked.connect(self.update_stats)
         
-        stats_layout.addWidget(total_stats)
+        stats_layout.addWidget(self.total_stats_label)
         stats_layout.addWidget(schedule_label)
         stats_layout.addWidget(schedule_placeholder)
         stats_layout.addWidget(refresh_btn)
@@ -242,87 +366,16 @@ class PhotoStudioApp(QMainWindow):
         layout.addWidget(stats_label)
         layout.addWidget(stats_widget)
         
+    def update_stats(self):
+        self.total_stats_label.setText(
+            f"Всего клиентов: {len(self.clients)}\n"
+            f"Всего бронирований: {len(self.bookings)}\n"
+            f"Общий доход: {self._total_income} руб"
+        )
+        
     def apply_styles(self):
         # Основные стили
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            
-            QLabel {
-                font-size: 14px;
-                color: #333;
-            }
-            
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                font-size: 14px;
-                border-radius: 4px;
-                min-width: 100px;
-            }
-            
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            
-            QLineEdit, QComboBox, QDateEdit, QTimeEdit, QSpinBox, QListWidget {
-                padding: 6px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #ddd;
-                background: white;
-            }
-            
-            QTabBar::tab {
-                background: #e0e0e0;
-                padding: 8px 16px;
-                border: 1px solid #ddd;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            
-            QTabBar::tab:selected {
-                background: white;
-                margin-bottom: -1px;
-            }
-            
-            QListWidget {
-                border: 1px solid #ddd;
-                background: white;
-                alternate-background-color: #f9f9f9;
-            }
-            
-            QListWidget::item {
-                padding: 6px;
-                border-bottom: 1px solid #eee;
-            }
-            
-            QListWidget::item:selected {
-                background-color: #e0f7fa;
-                color: black;
-            }
-        """)
-        
-        # Заголовки
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        
-        for tab in self.findChildren(QLabel, "Статистика фотостудии"):
-            tab.setFont(title_font)
-            tab.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
+        self.setStyleSheet(_STYLESHEET)
         
     def add_client(self):
         first_name = self.first_name_edit.text().strip()
@@ -335,16 +388,19 @@ class PhotoStudioApp(QMainWindow):
             return
             
         client = {
-            "id": len(self.clients) + 1,
+            "id": self._next_client_id,
             "first_name": first_name,
             "last_name": last_name,
             "phone": phone,
             "discount": discount
         }
         
+        self._next_client_id += 1
         self.clients.append(client)
         self.client_combo.addItem(f"{first_name} {last_name} ({phone})", client)
-        self.clients_list.addItem(f"{first_name} {last_name}, тел.: {phone}, скидка: {discount}%")
+        item = QListWidgetItem(f"{first_name} {last_name}, тел.: {phone}, скидка: {discount}%")
+        item.setData(Qt.UserRole, client)
+        self.clients_list.addItem(item)
         
         # Очищаем поля
         self.first_name_edit.clear()
@@ -352,7 +408,7 @@ class PhotoStudioApp(QMainWindow):
         self.phone_edit.clear()
         self.discount_spin.setValue(0)
         
-        QMessageBox.information(self, "Успех", "Клиент успешно добавлен")
+        self.statusBar().showMessage("Клиент успешно добавлен", 3000)
         
     def create_booking(self):
         if self.client_combo.currentIndex() == -1:
@@ -365,17 +421,11 @@ class PhotoStudioApp(QMainWindow):
         duration = self.duration_spin.value()
         
         # Выбранное оборудование
-        selected_equipment = []
-        for item in self.equipment_list.selectedItems():
-            eq_name = item.text().split(" (+")[0]
-            for eq in self.equipment:
-                if eq["name"] == eq_name:
-                    selected_equipment.append(eq)
-                    break
+        selected_equipment = [item.data(Qt.UserRole) for item in self.equipment_list.selectedItems()]
         
         # Расчет стоимости
-        hall_cost = hall_data["price"] * duration
-        equipment_cost = sum(eq["price"] * duration for eq in selected_equipment)
+        hall_cost = hall_data.price * duration
+        equipment_cost = sum(eq.price * duration for eq in selected_equipment)
         total_cost = hall_cost + equipment_cost
         
         # Получаем данные клиента
@@ -401,12 +451,16 @@ class PhotoStudioApp(QMainWindow):
         }
         
         self.bookings.append(booking)
-        self.bookings_list.addItem(
-            f"{date} {time} - {client_data['first_name']} {client_data['last_name']}, "
-            f"Зал {hall_data['number']}, {duration} ч., {total_cost} руб"
+        self._total_income += total_cost
+        first_name, last_name = client_data["first_name"], client_data["last_name"]
+        hall_number = hall_data.number
+        item = QListWidgetItem(
+            f"{date} {time} - {first_name} {last_name}, Зал {hall_number}, {duration} ч., {total_cost} руб"
         )
+        item.setData(Qt.UserRole, booking)
+        self.bookings_list.addItem(item)
         
-        QMessageBox.information(self, "Успех", "Бронирование успешно создано")
+        self.statusBar().showMessage("Бронирование успешно создано", 3000)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -1,15 +1,15 @@
 import sys
 import logging
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from datetime import datetime
-from typing import List, Dict, Callable
+from datetime import datetime, date as _date, time as _time
+from typing import List, Dict, Set, Union, Callable
 
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QLineEdit, QPushButton, QListWidget, QComboBox, 
-                            QDateEdit, QTimeEdit, QSpinBox, QTabWidget, QMessageBox)
-from PyQt5.QtCore import QDate, QTime, Qt
-from PyQt5.QtGui import QFont, QIcon
+                            QDateEdit, QTimeEdit, QSpinBox, QTabWidget, QMessageBox, QListView,
+                            QListWidgetItem)
+from PyQt5.QtCore import QDate, QTime, Qt, QAbstractListModel, QModelIndex, QTimer
+from PyQt5.QtGui import QIcon, QStandardItemModel, QStandardItem
 
 # Настройка логирования
 logging.basicConfig(
@@ -20,13 +20,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger('PhotoStudio')
 
+# Форматы даты и времени бронирования
+DATE_FORMAT = "%d.%m.%Y"
+TIME_FORMAT = "%H:%M"
+
+def _to_date(value: Union[str, _date]) -> _date:
+    return datetime.strptime(value, DATE_FORMAT).date() if isinstance(value, str) else value
+
+def _to_time(value: Union[str, _time]) -> _time:
+    return datetime.strptime(value, TIME_FORMAT).time() if isinstance(value, str) else value
+
+def _slot_key(date: _date, time: _time) -> int:
+    """Слот бронирования одним числом: минуты от начала календаря"""
+    return date.toordinal() * 1440 + time.hour * 60 + time.minute
+
 # ==================== Базовые классы и исключения ====================
 class StudioBaseError(Exception):
     """Базовое исключение для фотостудии"""
     def __init__(self, message="Произошла ошибка в работе фотостудии"):
         self.message = message
         super().__init__(self.message)
-        logger.error(f"StudioBaseError: {message}")
+        logger.error("StudioBaseError: %s", message)
 
     def __str__(self):
         return f"Ошибка фотостудии: {self.message}"
@@ -59,6 +73,7 @@ class HallNotAvailableError(BookingError):
 # ==================== Бизнес-логика ====================
 class PhotographicEntity(ABC):
     """Абстрактный класс для сущностей фотостудии"""
+    __slots__ = ()
     
     @abstractmethod
     def get_info(self) -> str:
@@ -73,22 +88,33 @@ class PhotographicEntity(ABC):
 
 class Person(PhotographicEntity):
     """Базовый класс для персон"""
+    __slots__ = ('_fname', '_lname', '_info')
+    
     def __init__(self, fname: str, lname: str):
         self._fname = fname
         self._lname = lname
+        self._info = f"{fname} {lname}"
         
     def get_info(self) -> str:
-        return f"{self._fname} {self._lname}"
+        return self._info
         
     def calculate_cost(self, hours: int) -> float:
         return 0
 
 class Client(Person):
     """Клиент фотостудии"""
+    __slots__ = ('_phone', '_discount', '_discount_multiplier')
+    
     def __init__(self, fname: str, lname: str, phone: str):
         super().__init__(fname, lname)
-        self.phone = phone
+        self._phone = phone
         self._discount = 0
+        self._discount_multiplier = 1.0
+
+    @property
+    def phone(self) -> str:
+        # Телефон - ключ клиента в Studio, поэтому после создания он не меняется
+        return self._phone
         
     def get_info(self) -> str:
         return f"Клиент: {super().get_info()}, Телефон: {self.phone}"
@@ -99,97 +125,172 @@ class Client(Person):
     def apply_discount(self, amount):
         if 0 <= amount <= 30:
             self._discount = amount
+            self._discount_multiplier = 1.0 - amount / 100.0
             return True
         return False
 
 class Hall(PhotographicEntity):
     """Зал для фотосессии"""
+    __slots__ = ('number', 'price', 'capacity', '_info')
+    
     def __init__(self, number: int, price: float, capacity: int):
         self.number = number
         self.price = price
         self.capacity = capacity
+        self._info = f"Зал {number}, Цена: {price} руб/час, Вместимость: {capacity} чел."
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Hall):
+            return NotImplemented
+        return self.number == other.number and self.price == other.price
+
+    def __hash__(self):
+        return hash((self.number, self.price))
 
     def get_info(self) -> str:
-        return f"Зал {self.number}, Цена: {self.price} руб/час, Вместимость: {self.capacity} чел."
+        return self._info
     
     def calculate_cost(self, hours: int) -> float:
         return self.price * hours
 
 class Equipment(PhotographicEntity):
     """Оборудование для съемки"""
+    __slots__ = ('name', 'price', '_info')
+    
     def __init__(self, name: str, price: float):
         self.name = name
         self.price = price
+        self._info = f"Оборудование: {name}, Цена: {price} руб/час"
 
     def get_info(self) -> str:
-        return f"Оборудование: {self.name}, Цена: {self.price} руб/час"
+        return self._info
     
     def calculate_cost(self, hours: int) -> float:
         return self.price * hours
 
 class Booking:
     """Бронирование фотостудии"""
-    def __init__(self, client: Client, hall: Hall, equipment: List[Equipment], date: str, time: str, duration: int):
+    __slots__ = ('client', 'hall', 'equipment', 'date', 'time', 'duration', '_slot_key', '_base_cost')
+    
+    def __init__(self, client: Client, hall: Hall, equipment: List[Equipment],
+                 date: Union[str, _date], time: Union[str, _time], duration: int):
         self.client = client
         self.hall = hall
         self.equipment = equipment
-        self.date = date
-        self.time = time
+        # Строки разбираются один раз, дальше сравниваются и хешируются date/time
+        self.date = _to_date(date)
+        self.time = _to_time(time)
+        self._slot_key = _slot_key(self.date, self.time)
         self.duration = duration
+        # Стоимость без скидки не меняется, а скидку клиента применяем при каждом вызове
+        self._base_cost = (hall.price + sum(eq.price for eq in equipment)) * duration
 
     def calculate_total_cost(self) -> float:
-        hall_cost = self.hall.calculate_cost(self.duration)
-        equipment_cost = sum(eq.calculate_cost(self.duration) for eq in self.equipment)
-        total = hall_cost + equipment_cost
-        return total * (1 - self.client._discount/100)
+        return self._base_cost * self.client._discount_multiplier
+
+    def summary(self) -> str:
+        """Краткое описание бронирования в одну строку"""
+        return (f"{self.date.strftime(DATE_FORMAT)} {self.time.strftime(TIME_FORMAT)} - "
+                f"{self.client._fname} {self.client._lname}, "
+                f"Зал {self.hall.number}, {self.duration} ч., "
+                f"{self.calculate_total_cost():.2f} руб")
 
     def __str__(self):
-        equipment_info = "\n".join([f"  - {eq.get_info()}" for eq in self.equipment])
+        equipment_info = "\n".join(f"  - {eq.get_info()}" for eq in self.equipment)
         return (f"Бронирование:\n"
                 f"Клиент: {self.client.get_info()}\n"
                 f"Зал: {self.hall.get_info()}\n"
                 f"Оборудование:\n{equipment_info}\n"
-                f"Дата: {self.date}, Время: {self.time}, Длительность: {self.duration} ч\n"
+                f"Дата: {self.date.strftime(DATE_FORMAT)}, Время: {self.time.strftime(TIME_FORMAT)}, "
+                f"Длительность: {self.duration} ч\n"
                 f"Общая стоимость: {self.calculate_total_cost():.2f} руб")
 
 class Studio:
     """Фотостудия для управления бронированиями"""
     def __init__(self):
         self.bookings: List[Booking] = []
-        self._halls: List[Hall] = []
-        self._equipment: List[Equipment] = []
-        self._clients: List[Client] = []
+        # Справочники хранятся по естественным ключам: номер зала, название, телефон
+        self._halls: Dict[int, Hall] = {}
+        self._equipment: Dict[str, Equipment] = {}
+        self._clients: Dict[str, Client] = {}
+        self._bookings_by_client: Dict[Client, List[Booking]] = {}
+        # Занятые залы по слоту (дата, время) для проверки доступности за O(1)
+        self._halls_at_slot: Dict[int, Set[Hall]] = {}
+        # Доход без скидки по клиентам: скидка клиента может измениться после бронирования
+        self._base_income_by_client: Dict[Client, float] = {}
 
     def add_hall(self, hall: Hall):
-        self._halls.append(hall)
+        if hall.number in self._halls:
+            raise StudioBaseError(f"Зал {hall.number} уже существует")
+        self._halls[hall.number] = hall
 
     def add_equipment(self, equipment: Equipment):
-        self._equipment.append(equipment)
+        if equipment.name in self._equipment:
+            raise StudioBaseError(f"Оборудование \"{equipment.name}\" уже существует")
+        self._equipment[equipment.name] = equipment
 
     def add_client(self, client: Client):
-        self._clients.append(client)
+        if client.phone in self._clients:
+            raise ClientError(client.get_info(), "Клиент с таким телефоном уже существует")
+        self._clients[client.phone] = client
 
     def add_booking(self, booking: Booking) -> bool:
         if not self._is_hall_available(booking.hall, booking.date, booking.time):
-            raise HallNotAvailableError(booking.hall.number, booking.date, booking.time)
+            raise HallNotAvailableError(booking.hall.number, booking.date.strftime(DATE_FORMAT),
+                                        booking.time.strftime(TIME_FORMAT))
             
         self.bookings.append(booking)
+        self._bookings_by_client.setdefault(booking.client, []).append(booking)
+        self._halls_at_slot.setdefault(booking._slot_key, set()).add(booking.hall)
+        client = booking.client
+        self._base_income_by_client[client] = self._base_income_by_client.get(client, 0.0) + booking._base_cost
         return True
 
-    def _is_hall_available(self, hall: Hall, date: str, time: str) -> bool:
-        for booking in self.bookings:
-            if booking.hall == hall and booking.date == date and booking.time == time:
-                return False
-        return True
+    def cancel_booking(self, client: Client) -> int:
+        """Отменяет все бронирования клиента и возвращает их количество.
+
+        Только программный API: в интерфейсе действия отмены нет.
+        Открытое окно после отмены нужно обновить через BookingListModel.refresh().
+        """
+        cancelled = self._bookings_by_client.pop(client, None)
+        if not cancelled:
+            raise ClientError(client.get_info(), "У клиента нет бронирований")
+        # Список перестраивается только если у клиента действительно есть бронирования
+        self.bookings = [b for b in self.bookings if b.client is not client]
+        for booking in cancelled:
+            booked = self._halls_at_slot[booking._slot_key]
+            booked.discard(booking.hall)
+            if not booked:
+                del self._halls_at_slot[booking._slot_key]
+        del self._base_income_by_client[client]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Отменено бронирований: %d (клиент: %s)", len(cancelled), client.get_info())
+        return len(cancelled)
+
+    def _is_hall_available(self, hall: Hall, date: Union[str, _date], time: Union[str, _time]) -> bool:
+        return hall not in self._halls_at_slot.get(_slot_key(_to_date(date), _to_time(time)), ())
+
+    def get_available_halls(self, date: Union[str, _date], time: Union[str, _time]) -> List[Hall]:
+        booked = self._halls_at_slot.get(_slot_key(_to_date(date), _to_time(time)), ())
+        return [hall for hall in self._halls.values() if hall not in booked]
+
+    def get_client_bookings(self, client: Client) -> List[Booking]:
+        return list(self._bookings_by_client.get(client, ()))
+
+    def get_total_income(self) -> float:
+        return sum(base * client._discount_multiplier
+                   for client, base in self._base_income_by_client.items())
 
     def get_clients(self) -> List[Client]:
-        return self._clients
+        return list(self._clients.values())
 
     def get_halls(self) -> List[Hall]:
-        return self._halls
+        return list(self._halls.values())
 
     def get_equipment(self) -> List[Equipment]:
-        return self._equipment
+        return list(self._equipment.values())
 
 # ==================== Адаптер для GUI ====================
 class StudioAdapter:
@@ -218,14 +319,13 @@ class StudioAdapter:
         return client
 
     def create_booking(self, client: Client, hall: Hall, equipment: List[Equipment], 
-                      date: str, time: str, duration: int) -> Booking:
+                      date: Union[str, _date], time: Union[str, _time], duration: int) -> Booking:
         booking = Booking(client, hall, equipment, date, time, duration)
         self.studio.add_booking(booking)
         return booking
 
-    def get_available_halls(self, date: str, time: str) -> List[Hall]:
-        return [hall for hall in self.studio.get_halls() 
-                if self.studio._is_hall_available(hall, date, time)]
+    def get_available_halls(self, date: Union[str, _date], time: Union[str, _time]) -> List[Hall]:
+        return self.studio.get_available_halls(date, time)
 
     def get_all_equipment(self) -> List[Equipment]:
         return self.studio.get_equipment()
@@ -234,23 +334,120 @@ class StudioAdapter:
         return self.studio.get_clients()
 
     def get_client_bookings(self, client: Client) -> List[Booking]:
-        return [b for b in self.studio.bookings if b.client == client]
+        return self.studio.get_client_bookings(client)
 
 # ==================== Графический интерфейс ====================
+class BookingListModel(QAbstractListModel):
+    """Модель списка бронирований, строки формируются только для видимых элементов"""
+    def __init__(self, studio: Studio, parent=None):
+        super().__init__(parent)
+        self._studio = studio
+        # Число строк, о которых уже знает представление
+        self._rows = len(studio.bookings)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Studio.cancel_booking может сократить список до вызова refresh()
+        if not index.isValid() or index.row() >= len(self._studio.bookings):
+            return None
+        booking = self._studio.bookings[index.row()]
+        if role == Qt.DisplayRole:
+            return booking.summary()
+        if role == Qt.UserRole:
+            return booking
+        return None
+
+    def append_last(self):
+        """Показывает бронирование, добавленное в конец списка студии"""
+        row = self._rows
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows += 1
+        self.endInsertRows()
+
+    def refresh(self):
+        # Полный сброс только для массовых изменений: он теряет выделение и прокрутку
+        self.beginResetModel()
+        self._rows = len(self._studio.bookings)
+        self.endResetModel()
+
 class PhotoStudioApp(QMainWindow):
+    _CAMERA_ICON = None
+    # Таблица стилей окна; заголовок статистики оформляется через objectName
+    _QSS = """
+        QMainWindow {
+            background-color: #f5f5f5;
+        }
+        QLabel {
+            font-size: 14px;
+            color: #333;
+        }
+        QPushButton {
+            background-color: #4CAF50;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            font-size: 14px;
+            border-radius: 4px;
+            min-width: 100px;
+        }
+        QPushButton:hover {
+            background-color: #45a049;
+        }
+        QLineEdit, QComboBox, QDateEdit, QTimeEdit, QSpinBox, QListWidget, QListView#bookingsList {
+            padding: 6px;
+            border: 1px solid #ccc;
+            border-radius: 4px;
+            font-size: 14px;
+        }
+        QTabWidget::pane {
+            border: 1px solid #ddd;
+            background: white;
+        }
+        QTabBar::tab {
+            background: #e0e0e0;
+            padding: 8px 16px;
+            border: 1px solid #ddd;
+            border-bottom: none;
+            border-radius: 4px;
+        }
+        QTabBar::tab:selected {
+            background: white;
+        }
+        QListWidget, QListView#bookingsList {
+            alternate-background-color: #f9f9f9;
+        }
+        QLabel#statsTitle {
+            font-size: 16pt;
+            font-weight: bold;
+            color: #2c3e50;
+            margin-bottom: 15px;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Фотостудия - Система бронирования")
-        self.setWindowIcon(QIcon("camera_icon.png"))
         self.setMinimumSize(900, 600)
+        # Загрузка иконки не должна задерживать первую отрисовку окна
+        QTimer.singleShot(0, self._set_window_icon)
         
         # Инициализация адаптера бизнес-логики
         self.adapter = StudioAdapter()
+        # Клиенты, еще не показанные в списках (выводятся пачкой в конце итерации цикла событий)
+        self._pending_clients: List[Client] = []
         
         # Настройка интерфейса
         self.init_ui()
         self.apply_styles()
         
+    def _set_window_icon(self):
+        # Иконка читается с диска один раз на процесс
+        if PhotoStudioApp._CAMERA_ICON is None:
+            PhotoStudioApp._CAMERA_ICON = QIcon("camera_icon.png")
+        self.setWindowIcon(PhotoStudioApp._CAMERA_ICON)
+        
     def init_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -314,6 +511,8 @@ class PhotoStudioApp(QMainWindow):
         self.client_combo = QComboBox()
         self.client_combo.setEditable(True)
         self.client_combo.setPlaceholderText("Выберите или введите нового клиента")
+        # Введенный вручную текст не должен попадать в список клиентов
+        self.client_combo.setInsertPolicy(QComboBox.NoInsert)
         client_layout.addWidget(self.client_combo)
         
         # Зал
@@ -354,7 +553,9 @@ class PhotoStudioApp(QMainWindow):
         equipment_layout.addWidget(QLabel("Дополнительное оборудование:"))
         self.equipment_list = QListWidget()
         for eq in self.adapter.studio.get_equipment():
-            self.equipment_list.addItem(f"{eq.name} (+{eq.price} руб/час)")
+            item = QListWidgetItem(f"{eq.name} (+{eq.price} руб/час)")
+            item.setData(Qt.UserRole, eq)
+            self.equipment_list.addItem(item)
         self.equipment_list.setSelectionMode(QListWidget.MultiSelection)
         equipment_layout.addWidget(self.equipment_list)
         
@@ -371,7 +572,14 @@ class PhotoStudioApp(QMainWindow):
         
         # Список бронирований
         bookings_list_label = QLabel("Активные бронирования:")
-        self.bookings_list = QListWidget()
+        self.bookings_model = BookingListModel(self.adapter.studio, self)
+        self.bookings_list = QListView()
+        # Селектор по имени, чтобы не задеть выпадающие списки QComboBox (тоже QListView)
+        self.bookings_list.setObjectName("bookingsList")
+        self.bookings_list.setModel(self.bookings_model)
+        self.bookings_list.setUniformItemSizes(True)
+        self.bookings_list.setLayoutMode(QListView.Batched)
+        self.bookings_list.setBatchSize(100)
         
         layout.addWidget(booking_form)
         layout.addWidget(bookings_list_label)
@@ -424,6 +632,9 @@ class PhotoStudioApp(QMainWindow):
         # Список клиентов
         clients_list_label = QLabel("Список клиентов:")
         self.clients_list = QListWidget()
+        self.clients_list.setUniformItemSizes(True)
+        self.clients_list.setLayoutMode(QListWidget.Batched)
+        self.clients_list.setBatchSize(100)
         
         layout.addWidget(client_form)
         layout.addWidget(clients_list_label)
@@ -436,6 +647,7 @@ class PhotoStudioApp(QMainWindow):
         layout = QVBoxLayout(tab)
         
         stats_label = QLabel("Статистика фотостудии")
+        stats_label.setObjectName("statsTitle")
         stats_label.setAlignment(Qt.AlignCenter)
         
         stats_widget = QWidget()
@@ -464,78 +676,44 @@ class PhotoStudioApp(QMainWindow):
         layout.addWidget(stats_widget)
         
     def apply_styles(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QLabel {
-                font-size: 14px;
-                color: #333;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                font-size: 14px;
-                border-radius: 4px;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QLineEdit, QComboBox, QDateEdit, QTimeEdit, QSpinBox, QListWidget {
-                padding: 6px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                font-size: 14px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ddd;
-                background: white;
-            }
-            QTabBar::tab {
-                background: #e0e0e0;
-                padding: 8px 16px;
-                border: 1px solid #ddd;
-                border-bottom: none;
-                border-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background: white;
-            }
-            QListWidget {
-                alternate-background-color: #f9f9f9;
-            }
-        """)
-        
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        
-        for label in self.findChildren(QLabel, "Статистика фотостудии"):
-            label.setFont(title_font)
-            label.setStyleSheet("color: #2c3e50; margin-bottom: 15px;")
+        self.setStyleSheet(self._QSS)
+    
+    @staticmethod
+    def _client_combo_item(client: Client) -> QStandardItem:
+        item = QStandardItem(f"{client._fname} {client._lname} ({client.phone})")
+        item.setData(client, Qt.UserRole)
+        return item
+    
+    @staticmethod
+    def _client_list_text(client: Client) -> str:
+        return f"{client._fname} {client._lname}, тел.: {client.phone}, скидка: {client._discount}%"
     
     def update_clients_combo(self):
-        self.client_combo.clear()
+        # Собираем модель целиком и подключаем ее одним вызовом
+        model = QStandardItemModel(self.client_combo)
         for client in self.adapter.get_all_clients():
-            self.client_combo.addItem(
-                f"{client._fname} {client._lname} ({client.phone})",
-                client
-            )
+            model.appendRow(self._client_combo_item(client))
+        self.client_combo.setModel(model)
     
     def update_clients_list(self):
+        # Перерисовываем список один раз после вставки всех строк
+        self.clients_list.setUpdatesEnabled(False)
         self.clients_list.clear()
-        for client in self.adapter.get_all_clients():
-            self.clients_list.addItem(
-                f"{client._fname} {client._lname}, тел.: {client.phone}, скидка: {client._discount}%"
-            )
+        self.clients_list.addItems([self._client_list_text(c) for c in self.adapter.get_all_clients()])
+        self.clients_list.setUpdatesEnabled(True)
+    
+    def _flush_client_updates(self):
+        # Дописываем только новых клиентов, без перестроения списков
+        clients, self._pending_clients = self._pending_clients, []
+        model = self.client_combo.model()
+        for client in clients:
+            model.appendRow(self._client_combo_item(client))
+        self.clients_list.addItems([self._client_list_text(c) for c in clients])
     
     def update_stats(self):
         clients_count = len(self.adapter.get_all_clients())
         bookings_count = len(self.adapter.studio.bookings)
-        total_income = sum(b.calculate_total_cost() for b in self.adapter.studio.bookings)
+        total_income = self.adapter.studio.get_total_income()
         
         self.total_stats_label.setText(
             f"Всего клиентов: {clients_count}\n"
@@ -556,9 +734,10 @@ class PhotoStudioApp(QMainWindow):
         try:
             client = self.adapter.add_client(first_name, last_name, phone, discount)
             
-            # Обновляем интерфейс
-            self.update_clients_combo()
-            self.update_clients_list()
+            # Обновляем интерфейс один раз за итерацию цикла событий
+            self._pending_clients.append(client)
+            if len(self._pending_clients) == 1:
+                QTimer.singleShot(0, self._flush_client_updates)
             
             # Очищаем поля
             self.first_name_edit.clear()
@@ -566,7 +745,7 @@ class PhotoStudioApp(QMainWindow):
             self.phone_edit.clear()
             self.discount_spin.setValue(0)
             
-            QMessageBox.information(self, "Успех", "Клиент успешно добавлен")
+            self.statusBar().showMessage("Клиент успешно добавлен", 3000)
             
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", f"Не удалось добавить клиента: {str(e)}")
@@ -579,18 +758,15 @@ class PhotoStudioApp(QMainWindow):
         try:
             client = self.client_combo.currentData()
             hall = self.hall_combo.currentData()
-            date = self.date_edit.date().toString("dd.MM.yyyy")
-            time = self.time_edit.time().toString("hh:mm")
+            date = self.date_edit.date().toPyDate()
+            time = self.time_edit.time().toPyTime()
             duration = self.duration_spin.value()
             
             # Получаем выбранное оборудование
-            selected_equipment = []
-            for i in range(self.equipment_list.count()):
-                if self.equipment_list.item(i).isSelected():
-                    selected_equipment.append(self.adapter.studio.get_equipment()[i])
+            selected_equipment = [item.data(Qt.UserRole) for item in self.equipment_list.selectedItems()]
             
             # Создаем бронирование
-            booking = self.adapter.create_booking(
+            self.adapter.create_booking(
                 client=client,
                 hall=hall,
                 equipment=selected_equipment,
@@ -599,16 +775,13 @@ class PhotoStudioApp(QMainWindow):
                 duration=duration
             )
             
-            # Добавляем в список
-            self.bookings_list.addItem(
-                f"{date} {time} - {client._fname} {client._lname}, "
-                f"Зал {hall.number}, {duration} ч., {booking.calculate_total_cost():.2f} руб"
-            )
+            # Дописываем новую строку, не сбрасывая выделение и прокрутку
+            self.bookings_model.append_last()
             
             # Обновляем статистику
             self.update_stats()
             
-            QMessageBox.information(self, "Успех", "Бронирование успешно создано")
+            self.statusBar().showMessage("Бронирование успешно создано", 3000)
             
         except HallNotAvailableError as e:
             QMessageBox.warning(self, "Ошибка", str(e))